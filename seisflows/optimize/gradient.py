@@ -200,9 +200,12 @@ class Gradient:
         if os.path.exists(model_npz):
             model = Model(path=model_npz)
         elif os.path.exists(model_npy):
-            model = np.load(model_npy)
+            # Copy-on-write memory map so large arrays are paged in lazily and
+            # callers can still modify the returned array without touching disk
+            model = np.load(model_npy, mmap_mode="c")
         elif os.path.exists(model_txt):
-            model = float(np.loadtxt(model_txt))
+            with open(model_txt, "r") as f:
+                model = float(f.read())
         else:
             raise FileNotFoundError(f"no optimization file found for '{name}'")
 
@@ -214,8 +217,9 @@ class Gradient:
 
         :type name: str
         :param name: name of the vector to overwrite
-        :type m: seisflows.tools.specfem.Model or float
-        :param m: Model to save to disk as npz array
+        :type m: seisflows.tools.specfem.Model or np.ndarray or float
+        :param m: Model to save to disk as npz array, array to save as npy, or
+            scalar to save as text
         """
         assert(name in self._acceptable_vectors)
 
@@ -224,11 +228,18 @@ class Gradient:
             m.model = m.split()  # overwrite m representation
             m.save(path=path)
         elif isinstance(m, np.ndarray):
+            # Plain arrays skip the Model container and are written as raw .npy
+            # Write to a temporary file and swap it in, so that memory maps
+            # returned by `load_vector` keep pointing at the previous file
             path = os.path.join(self.path.scratch, f"{name}.npy")
-            np.save(path=path)
+            with open(f"{path}.tmp", "wb") as f:
+                np.save(f, m)
+            os.replace(f"{path}.tmp", path)
         elif isinstance(m, (float, int)):
             path = os.path.join(self.path.scratch, f"{name}.txt")
-            np.savetxt(path, [m])
+            # Same formatting as np.savetxt, without its per-call overhead
+            with open(path, "w") as f:
+                f.write(f"{m:.18e}\n")
         else:
             raise TypeError(f"optimize.save unrecognized type error {type(m)}")
 
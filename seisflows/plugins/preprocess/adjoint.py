@@ -47,12 +47,14 @@ def envelope(syn, obs, nt, dt, eps=0.05, *args, **kwargs):
     :type dt: float
     :param dt: time step in sec
     """
-    env_syn = abs(analytic(syn))
+    # Analytic signal of the synthetics is used twice, only compute it once
+    an_syn = analytic(syn)
+    env_syn = abs(an_syn)
     env_obs = abs(analytic(obs))
 
     env_tmp = (env_syn - env_obs) / (env_syn + eps * env_syn.max())
 
-    wadj = env_tmp * syn - np.imag(analytic(env_tmp * np.imag(analytic(syn))))
+    wadj = env_tmp * syn - np.imag(analytic(env_tmp * np.imag(an_syn)))
 
     return wadj
 
@@ -70,20 +72,19 @@ def instantaneous_phase(syn, obs, nt, dt, eps=0.05, *args, **kwargs):
     :type dt: float
     :param dt: time step in sec
     """
-    r = np.real(analytic(syn))
-    i = np.imag(analytic(syn))
-    phi_syn = np.arctan2(i, r)
+    # Analytic signals are reused below, only compute them once
+    an_syn = analytic(syn)
+    an_obs = analytic(obs)
 
-    r = np.real(analytic(obs))
-    i = np.imag(analytic(obs))
-    phi_obs = np.arctan2(i, r)
+    phi_syn = np.arctan2(np.imag(an_syn), np.real(an_syn))
+    phi_obs = np.arctan2(np.imag(an_obs), np.real(an_obs))
 
     phi_rsd = phi_syn - phi_obs
-    env_syn = abs(analytic(syn))
-    env_max = max(env_syn**2.)
+    env_syn2 = abs(an_syn) ** 2.
+    env_max = env_syn2.max()
 
-    wadj_1 = phi_rsd * np.imag(analytic(syn)) / (env_syn ** 2. + eps * env_max) 
-    wadj_2 = np.imag(analytic(phi_rsd * syn / (env_syn**2. + eps * env_max)))
+    wadj_1 = phi_rsd * np.imag(an_syn) / (env_syn2 + eps * env_max)
+    wadj_2 = np.imag(analytic(phi_rsd * syn / (env_syn2 + eps * env_max)))
  
     wadj = wadj_1 + wadj_2
 
@@ -106,7 +107,7 @@ def traveltime(syn, obs, nt, dt, *args, **kwargs):
     wadj = np.zeros(nt)
 
     wadj[1:-1] = (syn[2:] - syn[0:-2]) / (2. * dt)
-    wadj *= 1. / (sum(wadj * wadj) * dt)
+    wadj *= 1. / (np.dot(wadj, wadj) * dt)
 
     wadj *= misfit.traveltime(syn, obs, nt, dt)
     return wadj
@@ -128,7 +129,7 @@ def traveltime_inexact(syn, obs, nt, dt, *args, **kwargs):
     wadj = np.zeros(nt)
 
     wadj[1:-1] = (syn[2:] - syn[0:-2]) / (2. * dt)
-    wadj *= 1. / (sum(wadj * wadj) * dt)
+    wadj *= 1. / (np.dot(wadj, wadj) * dt)
 
     wadj *= misfit.traveltime_inexact(syn, obs, nt, dt)
 
@@ -148,7 +149,7 @@ def amplitude(syn, obs, nt, dt, *args, **kwargs):
     :type dt: float
     :param dt: time step in sec
     """
-    wadj = 1. / (sum(syn * syn) * dt) * syn
+    wadj = 1. / (np.dot(syn, syn) * dt) * syn
     wadj *= misfit.amplitude(syn, obs, nt, dt)
 
     return wadj
@@ -212,16 +213,20 @@ def instantaneous_phase2(syn, obs, nt, dt, eps=0., *args, **kwargs):
     esyn = abs(analytic(syn))
     eobs = abs(analytic(obs))
 
-    esyn1 = esyn + eps * max(esyn)
-    eobs1 = eobs + eps * max(eobs)
-    esyn3 = esyn ** 3 + eps * max(esyn ** 3)
+    # Hilbert transform of the synthetics is reused below, only compute once
+    hsyn = hilbert(syn)
+    esyn_cubed = esyn ** 3
+
+    esyn1 = esyn + eps * esyn.max()
+    eobs1 = eobs + eps * eobs.max()
+    esyn3 = esyn_cubed + eps * esyn_cubed.max()
 
     diff1 = (syn / esyn1) - (obs / eobs1)
-    diff2 = (hilbert(syn) / esyn1) - (hilbert(obs) / eobs1)
+    diff2 = (hsyn / esyn1) - (hilbert(obs) / eobs1)
 
-    part1 = diff1 * hilbert(syn) ** 2 / esyn3 
-    part2 = diff2 * syn * hilbert(syn) / esyn3
-    part3 = diff1 * syn * hilbert(syn) / esyn3 - diff2 * syn ** 2 / esyn3
+    part1 = diff1 * hsyn ** 2 / esyn3
+    part2 = diff2 * syn * hsyn / esyn3
+    part3 = diff1 * syn * hsyn / esyn3 - diff2 * syn ** 2 / esyn3
 
     wadj = part1 - part2 + hilbert(part3)
 
@@ -33,7 +33,7 @@ def waveform(syn, obs, nt, dt, *args, **kwargs):
     """
     wrsd = syn - obs
 
-    return np.sqrt(np.sum(wrsd * wrsd * dt))
+    return np.sqrt(np.dot(wrsd, wrsd) * dt)
 
 
 def envelope(syn, obs, nt, dt, *args, **kwargs):
@@ -55,7 +55,7 @@ def envelope(syn, obs, nt, dt, *args, **kwargs):
     # Residual of envelopes
     env_rsd = env_syn - env_obs
 
-    return np.sqrt(np.sum(env_rsd * env_rsd * dt))
+    return np.sqrt(np.dot(env_rsd, env_rsd) * dt)
 
 
 def instantaneous_phase(syn, obs, nt, dt, *args, **kwargs):
@@ -71,17 +71,16 @@ def instantaneous_phase(syn, obs, nt, dt, *args, **kwargs):
     :type dt: float
     :param dt: time step in sec
     """
-    r = np.real(analytic(syn))
-    i = np.imag(analytic(syn))
-    phi_syn = np.arctan2(i, r)
+    # Only compute each analytic signal once for both real and imaginary parts
+    an_syn = analytic(syn)
+    an_obs = analytic(obs)
 
-    r = np.real(analytic(obs))
-    i = np.imag(analytic(obs))
-    phi_obs = np.arctan2(i, r)
+    phi_syn = np.arctan2(np.imag(an_syn), np.real(an_syn))
+    phi_obs = np.arctan2(np.imag(an_obs), np.real(an_obs))
 
     phi_rsd = phi_syn - phi_obs
 
-    return np.sqrt(np.sum(phi_rsd * phi_rsd * dt))
+    return np.sqrt(np.dot(phi_rsd, phi_rsd) * dt)
 
 
 def traveltime(syn, obs, nt, dt, *args, **kwargs):
@@ -141,7 +140,7 @@ def amplitude(syn, obs, nt, dt, *args, **kwargs):
     else:
         wrsd = syn[:-ioff] - obs[ioff:]
 
-    return np.sqrt(np.sum(wrsd * wrsd * dt))
+    return np.sqrt(np.dot(wrsd, wrsd) * dt)
 
 
 def envelope2(syn, obs, nt, dt, *args, **kwargs):
@@ -203,7 +202,7 @@ def instantaneous_phase2(syn, obs, nt, dt, eps=0., *args, **kwargs):
 
     diff = (syn / env_syn1) - (obs / env_obs1)
 
-    return np.sqrt(np.sum(diff * diff * dt))
+    return np.sqrt(np.dot(diff, diff) * dt)
 
 
 def displacement(*args, **kwargs):
@@ -6,6 +6,7 @@ seismic data, apply preprocessing such as filtering, quantify misfit,
 and write adjoint sources that are expected by the solver.
 """
 import os
+import shutil
 import numpy as np
 from glob import glob
 from obspy import read as obspy_read
@@ -116,15 +117,16 @@ class Default:
         self.unit_output = unit_output.upper()
         self.misfit = misfit
         self.adjoint = adjoint
-        self.normalize = normalize
 
-        self.filter = filter
+        # Choices are case-insensitive; uppercase them once here rather than
+        # every time a stream is processed
+        self.filter = filter.upper() if filter else filter
         self.min_period = min_period
         self.max_period = max_period
         self.min_freq = min_freq
         self.max_freq = max_freq
-        self.mute = mute or []
-        self.normalize = normalize or []
+        self.mute = [_.upper() for _ in mute or []]
+        self.normalize = [_.upper() for _ in normalize or []]
 
         # Mute arrivals sub-parameters
         self.early_slope = early_slope
@@ -173,33 +175,31 @@ class Default:
         # Data normalization option
         if self.normalize:
             acceptable_norms = {"TNORML1", "TNORML2", "ENORML1", "ENORML2"}
-            chosen_norms = [_.upper() for _ in self.normalize]
-            assert(set(chosen_norms).issubset(acceptable_norms))
+            assert(set(self.normalize).issubset(acceptable_norms))
 
         # Data muting options
         if self.mute:
             acceptable_mutes = {"EARLY", "LATE", "LONG", "SHORT"}
-            chosen_mutes = [_.upper() for _ in self.mute]
-            assert(set(chosen_mutes).issubset(acceptable_mutes))
-            if "EARLY" in chosen_mutes:
+            assert(set(self.mute).issubset(acceptable_mutes))
+            if "EARLY" in self.mute:
                 assert(self.early_slope is not None)
                 assert(self.early_slope >= 0.)
                 assert(self.early_const is not None)
-            if "LATE" in chosen_mutes:
+            if "LATE" in self.mute:
                 assert(self.late_slope is not None)
                 assert(self.late_slope >= 0.)
                 assert(self.late_const is not None)
-            if "SHORT" in chosen_mutes:
+            if "SHORT" in self.mute:
                 assert(self.short_dist is not None)
                 assert (self.short_dist > 0)
-            if "LONG" in chosen_mutes:
+            if "LONG" in self.mute:
                 assert(self.long_dist is not None)
                 assert (self.long_dist > 0)
 
         # Data filtering options that will be passed to ObsPy filters
         if self.filter:
             acceptable_filters = ["BANDPASS", "LOWPASS", "HIGHPASS"]
-            assert self.filter.upper() in acceptable_filters, \
+            assert self.filter in acceptable_filters, \
                 f"self.filter must be in {acceptable_filters}"
 
             # Set the min/max frequencies and periods, frequency takes priority
@@ -214,16 +214,16 @@ class Default:
                 self.max_freq =  1 / self.min_period
 
             # Check that the correct filter bounds have been set
-            if self.filter.upper() == "BANDPASS":
+            if self.filter == "BANDPASS":
                 assert(self.min_freq is not None and
                        self.max_freq is not None), \
                     ("BANDPASS filter PAR.MIN_PERIOD and PAR.MAX_PERIOD or " 
                      "PAR.MIN_FREQ and PAR.MAX_FREQ")
-            elif self.filter.upper() == "LOWPASS":
+            elif self.filter == "LOWPASS":
                 assert(self.max_freq is not None or
                        self.min_period is not None),\
                     "LOWPASS requires PAR.MAX_FREQ or PAR.MIN_PERIOD"
-            elif self.filter.upper() == "HIGHPASS":
+            elif self.filter == "HIGHPASS":
                 assert(self.min_freq is not None or
                        self.max_period is not None),\
                     "HIGHPASS requires PAR.MIN_FREQ or PAR.MAX_PERIOD"
@@ -236,13 +236,13 @@ class Default:
                 "PAR.MIN_FREQ < PAR.MAX_FREQ"
             )
 
-        assert(self.syn_data_format.upper() in self._syn_acceptable_data_formats), \
+        assert(self.syn_data_format in self._syn_acceptable_data_formats), \
             f"synthetic data format must be in {self._syn_acceptable_data_formats}"
 
-        assert(self.obs_data_format.upper() in self._obs_acceptable_data_formats), \
+        assert(self.obs_data_format in self._obs_acceptable_data_formats), \
             f"observed data format must be in {self._obs_acceptable_data_formats}"
 
-        assert(self.unit_output.upper() in self._acceptable_unit_output), \
+        assert(self.unit_output in self._acceptable_unit_output), \
             f"unit output must be in {self._acceptable_unit_output}"
 
     def setup(self):
@@ -283,7 +283,7 @@ class Default:
         :type fid: str
         :param fid: path to file to write stream to
         """
-        if self.syn_data_format.upper() == "SU":
+        if self.syn_data_format == "SU":
             for tr in st:
                 # Work around for ObsPy data type conversion
                 tr.data = tr.data.astype(np.float32)
@@ -297,7 +297,7 @@ class Default:
             # Write data to file
             st.write(fid, format="SU")
 
-        elif self.syn_data_format.upper() == "ASCII":
+        elif self.syn_data_format == "ASCII":
             for tr in st:
                 # Float provides time difference between starttime and default
                 time_offset = float(tr.stats.starttime)
@@ -340,7 +340,8 @@ class Default:
         :param output: path to save the new adjoint traces to.
         """
         for fid in data_filenames:
-            st = self.read(fid=fid, data_format=self.syn_data_format).copy()
+            # Freshly read from disk, so we can zero out the data in place
+            st = self.read(fid=fid, data_format=self.syn_data_format)
             fid = os.path.basename(fid)  # drop any path before filename
             for tr in st:
                 tr.data *= 0
@@ -368,18 +369,29 @@ class Default:
         channels = [os.path.basename(syn).split('.')[2] for syn in synthetic]
         channels = list(set(channels))
 
-        st = self.read(fid=synthetic[0], data_format=self.syn_data_format)
-        for tr in st:
-            tr.data *= 0.
+        # List the directory once rather than checking each file individually
+        existing = set(os.listdir(save_adjsrcs))
 
+        missing = []
         for adj_sta in adj_stations:
             sta = adj_sta[0]
             net = adj_sta[1]
             for chan in channels:
                 adj_trace = adj_template.format(net=net, sta=sta, chan=chan)
-                adj_trace = os.path.join(save_adjsrcs, adj_trace)
-                if not os.path.isfile(adj_trace):
-                    self.write(st=st, fid=adj_trace)
+                if adj_trace not in existing:
+                    missing.append(os.path.join(save_adjsrcs, adj_trace))
+
+        if not missing:
+            return
+
+        # Every missing adjoint trace is the same zero trace, so only read and
+        # write it once, and then copy the file for all the others
+        st = self.read(fid=synthetic[0], data_format=self.syn_data_format)
+        for tr in st:
+            tr.data *= 0.
+        self.write(st=st, fid=missing[0])
+        for adj_trace in missing[1:]:
+            shutil.copyfile(missing[0], adj_trace)
 
     def _rename_as_adjoint_source(self, fid):
         """
@@ -388,9 +400,9 @@ class Default:
         a '.adj' to the end of the filename
         """
         if not fid.endswith(".adj"):
-            if self.syn_data_format.upper() == "SU":
+            if self.syn_data_format == "SU":
                 fid = f"{fid}.adj"
-            elif self.syn_data_format.upper() == "ASCII":
+            elif self.syn_data_format == "ASCII":
                 # Differentiate between SPECFEM3D and 3D_GLOBE
                 # SPECFEM3D: NN.SSSS.CCC.sem?
                 # SPECFEM3D_GLOBE: NN.SSSS.CCC.sem.ascii
@@ -413,8 +425,9 @@ class Default:
         """
         source_name = source_name or self._source_names[get_task_id()]
 
-        obs_path = os.path.join(self.path.solver, source_name, "traces", "obs")
-        syn_path = os.path.join(self.path.solver, source_name, "traces", "syn")
+        trace_dir = os.path.join(self.path.solver, source_name, "traces")
+        obs_path = os.path.join(trace_dir, "obs")
+        syn_path = os.path.join(trace_dir, "syn")
 
         observed = sorted(os.listdir(obs_path))
         synthetic = sorted(os.listdir(syn_path))
@@ -425,7 +438,7 @@ class Default:
         # verify observed traces format
         obs_ext = list(set([os.path.splitext(x)[-1] for x in observed]))
 
-        if self.obs_data_format.upper() == "ASCII":
+        if self.obs_data_format == "ASCII":
             obs_ext_ok = obs_ext[0].upper() == ".ASCII" or \
                          obs_ext[0].upper() == f".SEM{self.unit_output[0]}"
         else:
@@ -463,12 +476,13 @@ class Default:
             f"have the same name including channel code"
         )
 
-        observed.clear()
-        synthetic.clear()
-
-        for file_name in matching_traces:
-            observed.append(os.path.join(obs_path, f"{file_name}{obs_ext[0]}"))
-            synthetic.append(os.path.join(syn_path, f"{file_name}{syn_ext[0]}"))
+        # Each data type has a single extension, checked above
+        obs_suffix = obs_ext[0]
+        syn_suffix = syn_ext[0]
+        observed = [os.path.join(obs_path, f"{fid}{obs_suffix}")
+                    for fid in matching_traces]
+        synthetic = [os.path.join(syn_path, f"{fid}{syn_suffix}")
+                     for fid in matching_traces]
 
         assert(len(observed) == len(synthetic)), (
             f"number of observed traces does not match length of synthetic for "
@@ -507,49 +521,65 @@ class Default:
             should be provided by the `optimize` module if we are running an
             inversion. Defaults to 0 if not given (1st evaluation)
         """
+        # The wrapper methods are always truthy, so check the chosen functions
+        # to determine what actually needs to be calculated
+        calc_residuals = bool(save_residuals and self.misfit)
+        calc_adjsrcs = bool(save_adjsrcs and self.adjoint)
+
         observed, synthetic = self._setup_quantify_misfit(source_name)
 
-        for obs_fid, syn_fid in zip(observed, synthetic):
-            obs = self.read(fid=obs_fid, data_format=self.obs_data_format)
-            syn = self.read(fid=syn_fid, data_format=self.syn_data_format)
-
-            # Process observations and synthetics identically
-            if self.filter:
-                obs = self._apply_filter(obs)
-                syn = self._apply_filter(syn)
-            if self.mute:
-                obs = self._apply_mute(obs)
-                syn = self._apply_mute(syn)
-            if self.normalize:
-                obs = self._apply_normalize(obs)
-                syn = self._apply_normalize(syn)
-
-            # Write the residuals/misfit and adjoint sources for each component
-            for tr_obs, tr_syn in zip(obs, syn):
-                # Simple check to make sure zip retains ordering
-                assert(tr_obs.stats.component == tr_syn.stats.component)
-                # Calculate the misfit value and write to file
-                if save_residuals and self._calculate_misfit:
-                    residual = self._calculate_misfit(
-                        obs=tr_obs.data, syn=tr_syn.data,
-                        nt=tr_syn.stats.npts, dt=tr_syn.stats.delta
-                    )
-                    with open(save_residuals, "a") as f:
-                        f.write(f"{residual:.2E}\n")
-
-                # Generate an adjoint source trace, write to file
-                if save_adjsrcs and self._generate_adjsrc:
-                    adjsrc = tr_syn.copy()
-                    adjsrc.data = self._generate_adjsrc(
-                        obs=tr_obs.data, syn=tr_syn.data,
-                        nt=tr_syn.stats.npts, dt=tr_syn.stats.delta
-                    )
-                    adjsrc = Stream(adjsrc)
-                    fid = os.path.basename(syn_fid)
-                    fid = self._rename_as_adjoint_source(fid)
-                    self.write(st=adjsrc, fid=os.path.join(save_adjsrcs, fid))
-
-        if save_adjsrcs and self._generate_adjsrc:
+        residuals = []
+        # Skip reading and processing waveforms if there is nothing to compute
+        if calc_residuals or calc_adjsrcs:
+            for obs_fid, syn_fid in zip(observed, synthetic):
+                obs = self.read(fid=obs_fid, data_format=self.obs_data_format)
+                syn = self.read(fid=syn_fid, data_format=self.syn_data_format)
+
+                # Process observations and synthetics identically
+                if self.filter:
+                    obs = self._apply_filter(obs)
+                    syn = self._apply_filter(syn)
+                if self.mute:
+                    obs = self._apply_mute(obs)
+                    syn = self._apply_mute(syn)
+                if self.normalize:
+                    obs = self._apply_normalize(obs)
+                    syn = self._apply_normalize(syn)
+
+                # Write the residuals/misfit and adjoint sources per component
+                for tr_obs, tr_syn in zip(obs, syn):
+                    # Simple check to make sure zip retains ordering
+                    assert(tr_obs.stats.component == tr_syn.stats.component)
+                    # Calculate the misfit value, written to file at the end
+                    if calc_residuals:
+                        residual = self._calculate_misfit(
+                            obs=tr_obs.data, syn=tr_syn.data,
+                            nt=tr_syn.stats.npts, dt=tr_syn.stats.delta
+                        )
+                        residuals.append(f"{residual:.2E}\n")
+
+                    # Generate an adjoint source trace, write to file
+                    if calc_adjsrcs:
+                        # Only copy the header, the data is replaced entirely
+                        adjsrc = Trace(
+                            data=self._generate_adjsrc(
+                                obs=tr_obs.data, syn=tr_syn.data,
+                                nt=tr_syn.stats.npts, dt=tr_syn.stats.delta
+                            ),
+                            header=tr_syn.stats.copy()
+                        )
+                        adjsrc = Stream(adjsrc)
+                        fid = os.path.basename(syn_fid)
+                        fid = self._rename_as_adjoint_source(fid)
+                        self.write(st=adjsrc,
+                                   fid=os.path.join(save_adjsrcs, fid))
+
+        # Write all residuals with a single open, rather than once per trace
+        if residuals:
+            with open(save_residuals, "a") as f:
+                f.writelines(residuals)
+
+        if calc_adjsrcs:
             self._check_adjoint_traces(source_name, save_adjsrcs, synthetic)
 
         # Exporting residuals to disk (output/) for more permanent storage
@@ -589,12 +619,12 @@ class Default:
         st.detrend("linear")
         st.taper(0.05, type="hann")
 
-        if self.filter.upper() == "BANDPASS":
+        if self.filter == "BANDPASS":
             st.filter("bandpass", zerophase=True, freqmin=self.min_freq,
                       freqmax=self.max_freq)
-        elif self.filter.upper() == "LOWPASS":
+        elif self.filter == "LOWPASS":
             st.filter("lowpass", zerophase=True, freq=self.max_freq)
-        elif self.filter.upper() == "HIGHPASS":
+        elif self.filter == "HIGHPASS":
             st.filter("highpass", zerophase=True, freq=self.min_freq)
 
         return st
@@ -614,16 +644,15 @@ class Default:
         :rtype: obspy.core.stream.Stream
         :return: muted stream object
         """
-        mute_choices = [_.upper() for _ in self.mute]
-        if "EARLY" in mute_choices:
+        if "EARLY" in self.mute:
             st = signal.mute_arrivals(st, slope=self.early_slope,
                                       const=self.early_const, choice="EARLY")
-        if "LATE" in mute_choices:
+        if "LATE" in self.mute:
             st = signal.mute_arrivals(st, slope=self.late_slope,
                                       const=self.late_const, choice="LATE")
-        if "SHORT" in mute_choices:
+        if "SHORT" in self.mute:
             st = signal.mute_offsets(st, dist=self.short_dist, choice="SHORT")
-        if "LONG" in mute_choices:
+        if "LONG" in self.mute:
             st = signal.mute_offsets(st, dist=self.long_dist, choice="LONG")
 
         return st
@@ -643,29 +672,28 @@ class Default:
         :return: stream with normalized traces
         """
         st_out = st.copy()
-        norm_choices = [_.upper() for _ in self.normalize]
 
         # Normalize an event by the L1 norm of all traces
-        if 'ENORML1' in norm_choices:
+        if 'ENORML1' in self.normalize:
             w = 0.
             for tr in st_out:
                 w += np.linalg.norm(tr.data, ord=1)
             for tr in st_out:
                 tr.data /= w
         # Normalize an event by the L2 norm of all traces
-        elif "ENORML2" in norm_choices:
+        elif "ENORML2" in self.normalize:
             w = 0.
             for tr in st_out:
                 w += np.linalg.norm(tr.data, ord=2)
             for tr in st_out:
                 tr.data /= w
         # Normalize each trace by its L1 norm
-        if "TNORML1" in norm_choices:
+        if "TNORML1" in self.normalize:
             for tr in st_out:
                 w = np.linalg.norm(tr.data, ord=1)
                 if w > 0:
                     tr.data /= w
-        elif "TNORML2" in norm_choices:
+        elif "TNORML2" in self.normalize:
             # normalize each trace by its L2 norm
             for tr in st_out:
                 w = np.linalg.norm(tr.data, ord=2)
@@ -681,8 +709,8 @@ def read_ascii(fid, origintime=None):
     pyatoa.utils.read.read_sem()
     """
     try:
-        times = np.loadtxt(fname=fid, usecols=0)
-        data = np.loadtxt(fname=fid, usecols=1)
+        # Parse the file once for both columns rather than once per column
+        times, data = np.loadtxt(fname=fid, usecols=(0, 1), unpack=True)
 
     # At some point in 2018, the Specfem developers changed how the ascii files
     # were formatted from two columns to comma separated values, and repeat
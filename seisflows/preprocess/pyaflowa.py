@@ -416,11 +416,9 @@ class Pyaflowa:
         # note: we are assuming the SeisFlows `solver` directory structure here.
         #   If we change how the default `solver` directory is named (defined by
         #   `solver.initialize_solver_directories()`), then this will break
-        obs_path = os.path.join(self.path.solver, source_name, "traces", "obs")
-        config.paths["waveforms"].append(obs_path)
-
-        syn_path = os.path.join(self.path.solver, source_name, "traces", "syn")
-        config.paths["synthetics"].append(syn_path)
+        trace_dir = os.path.join(self.path.solver, source_name, "traces")
+        config.paths["waveforms"].append(os.path.join(trace_dir, "obs"))
+        config.paths["synthetics"].append(os.path.join(trace_dir, "syn"))
 
         return config
 
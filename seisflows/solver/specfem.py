@@ -20,7 +20,7 @@ TODO
 import os
 import sys
 import subprocess
-from glob import glob
+from glob import glob, iglob
 
 from seisflows import logger
 from seisflows.tools import msg, unix
@@ -237,13 +237,14 @@ class Specfem:
                os.path.exists(self.path.model_init)), \
             f"`path_model_init` is required for the solver, but does not exist"
 
-        assert(len(glob(os.path.join(self.path.model_init, "*")))), \
+        assert(next(iglob(os.path.join(self.path.model_init, "*")), None)), \
             f"`path_model_init` is empty but should have model files"
 
         if self.path.model_true is not None:
             assert(os.path.exists(self.path.model_true)), \
                 f"`path_model_true` is provided but does not exist"
-            assert(len(glob(os.path.join(self.path.model_true, "*")))), \
+            assert(next(iglob(os.path.join(self.path.model_true, "*")),
+                        None)), \
                 f"`path_model_true` is empty but should have model files"
 
         # Check that the number of tasks/events matches the number of events
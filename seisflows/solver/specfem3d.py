@@ -4,7 +4,7 @@ This class provides utilities for the Seisflows solver interactions with
 Specfem3D Cartesian.
 """
 import os
-from glob import glob
+from glob import glob, iglob
 from seisflows import logger
 from seisflows.tools import unix
 from seisflows.tools.specfem import setpar, getpar
@@ -142,7 +142,8 @@ class Specfem3D(Specfem):
 
             # Database files only need to be made once, usually at the first
             # evaluation. Once made, we don't have to run xmeshfem3D anymore.
-            if not glob(os.path.join(self.model_databases, "proc*_Database")):
+            if not next(iglob(os.path.join(self.model_databases,
+                                           "proc*_Database")), None):
                 executables = ["bin/xmeshfem3D"] + executables
 
         # SPECFEM3D has to deal with attenuation
@@ -13,7 +13,7 @@ actually submitting to any job scheduler.
 import os
 import sys
 import subprocess
-from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures import ThreadPoolExecutor, wait
 from seisflows import logger, ROOT_DIR
 from seisflows.tools.unix import nproc
 from seisflows.tools.config import pickle_function_list
@@ -181,9 +181,11 @@ class Cluster(Workstation):
         # Don't need to spin up concurrent.futures for a single run
         if single:
             self._run_task(run_call=run_call, task_id=0)
-        # Run tasks in parallel and wait for all of them to finish
+        # Run tasks in parallel and wait for all of them to finish. Each task is
+        # an external subprocess, so threads are enough to run them
+        # concurrently without pickling `self` into worker processes
         else:
-            with ProcessPoolExecutor(max_workers=self.ntask_max) as executor:
+            with ThreadPoolExecutor(max_workers=self.ntask_max) as executor:
                 futures = [executor.submit(self._run_task, run_call, task_id)
                            for task_id in range(ntasks)]
             wait(futures)
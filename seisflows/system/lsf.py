@@ -202,7 +202,7 @@ class Lsf(Cluster):
             return [job]
         else:
             number_jobs = range(1, self.par.NSRC + 1)
-            return ["{job}[{}]".format(_) for _ in number_jobs]
+            return [f"{job}[{_}]" for _ in number_jobs]
 
     def _query(self, jobid):
         """
@@ -212,11 +212,12 @@ class Lsf(Cluster):
         :param jobid: job id to query LSF system about
         """
         # Write the job status output to a temporary file
-        with open(os.path.join(self.path.SYSTEM, "job_status", "w")) as f:
-            subprocess.call('bjobs -a -d "{jobid}"', stdout=f)
+        job_status = os.path.join(self.path.SYSTEM, "job_status")
+        with open(job_status, "w") as f:
+            subprocess.call(f'bjobs -a -d "{jobid}"', shell=True, stdout=f)
 
         # Read the job status back from the text file
-        with open(os.path.join(self.path.SYSTEM, "job_status", "r")) as f:
+        with open(job_status, "r") as f:
             lines = f.readlines()
             state = lines[1].split()[2].strip()
 
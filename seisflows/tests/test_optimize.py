@@ -204,6 +204,26 @@ def test_optimize_checkpoint_reload(tmpdir):
     assert(new_optimize.step_count == rand_val)
 
 
+def test_optimize_save_load_vector_array(tmpdir):
+    """
+    Plain NumPy arrays are saved as raw .npy files rather than being wrapped in
+    a Model. Make sure they round trip through save/load
+    """
+    optimize = Gradient(path_optimize=tmpdir)
+    arr = np.arange(10, dtype="float32")
+    optimize.save_vector("g_try", arr)
+    assert(os.path.exists(os.path.join(tmpdir, "g_try.npy")))
+
+    arr_loaded = optimize.load_vector("g_try")
+    assert(np.array_equal(arr, arr_loaded))
+    assert(arr_loaded.dtype == arr.dtype)
+
+    # Overwriting the vector must not disturb previously loaded arrays
+    optimize.save_vector("g_try", arr * 2)
+    assert(np.array_equal(arr, arr_loaded))
+    assert(np.array_equal(arr * 2, optimize.load_vector("g_try")))
+
+
 def test_optimize_attempt_line_search_restart(tmpdir,
                                               setup_optimization_vectors):
     """
@@ -116,6 +116,21 @@ def test_default_quantify_misfit(tmpdir):
     assert(float(residuals[0]) == pytest.approx(0.0269, 3))
 
 
+def test_default_case_insensitive_choices():
+    """
+    Mute, normalize and filter choices are case-insensitive and are stored in
+    uppercase so that per-stream processing does not need to convert them
+    """
+    preprocess = Default(mute=["early", "Long"], normalize=["tnorml2"],
+                         filter="bandpass", min_period=1, max_period=10,
+                         early_slope=0., early_const=0., long_dist=1.)
+    preprocess.check()
+
+    assert(preprocess.mute == ["EARLY", "LONG"])
+    assert(preprocess.normalize == ["TNORML2"])
+    assert(preprocess.filter == "BANDPASS")
+
+
 def test_pyaflowa_setup(tmpdir):
     """
     Test setup procedure for SeisFlows which internalizes some workflow
@@ -9,11 +9,38 @@ from seisflows import ROOT_DIR
 from seisflows.tools.config import Dict
 from seisflows.tools.model import Model
 from seisflows.tools.config import custom_import
+from seisflows.tools.specfem import read_fortran_binary, write_fortran_binary
+from seisflows.tools.signal import (get_offsets, mask, mute_arrivals,
+                                    mute_offsets)
+from obspy import Stream, Trace
+from obspy.core.util import AttribDict
 
 
 TEST_DIR = os.path.join(ROOT_DIR, "tests")
 
 
+@pytest.fixture
+def su_stream():
+    """
+    SU-style Stream of constant traces recorded by receivers at known
+    distances (1000, 5000, 9000 m) from a source that is not at the origin
+    """
+    sx, sy = 500., 250.
+    receivers = [(sx + 1000., sy), (sx, sy + 5000.), (sx - 9000., sy)]
+
+    st = Stream()
+    for rx, ry in receivers:
+        tr = Trace(data=np.ones(2000, dtype="float32"),
+                   header={"delta": 0.01})
+        tr.stats.su = AttribDict({"trace_header": AttribDict({
+            "source_coordinate_x": sx, "source_coordinate_y": sy,
+            "group_coordinate_x": rx, "group_coordinate_y": ry})}
+        )
+        st.append(tr)
+
+    return st
+
+
 def test_specfem_model(tmpdir):
     """
     Make sure we can dynamically load SPECFEM models in various formats
@@ -37,6 +64,13 @@ def test_specfem_model(tmpdir):
     assert(m.model.vp[0][0] == 5800.)
     assert(m.model.vs[0][0] == 3500.)
 
+    # Requesting a subset of parameters only reads those, and unavailable
+    # parameters are rejected up front
+    m_vp = Model(path=model_data, fmt=".bin", parameters=["vp"])
+    assert(list(m_vp.model.keys()) == ["vp"])
+    with pytest.raises(AssertionError):
+        Model(path=model_data, fmt=".bin", parameters=["vp", "rho"])
+
     assert(len(m.merge() == len(m.model.vs[0]) + len(m.model.vp[0])))
     assert(len(m.split()) == len(m.parameters))
 
@@ -58,6 +92,109 @@ def test_specfem_model(tmpdir):
     assert(m.parameters == ["x"])
 
 
+def test_fortran_binary(tmpdir):
+    """
+    Check that Fortran binary files round trip through write and read, and
+    that the record markers hold the correct byte count
+    """
+    fid = os.path.join(tmpdir, "proc000000_vp.bin")
+    arr = np.linspace(0, 1, 101)  # float64 should be cast to float32
+    write_fortran_binary(arr=arr, filename=fid)
+
+    assert(os.path.getsize(fid) == 4 * len(arr) + 8)
+    assert(np.fromfile(fid, dtype="int32", count=1)[0] == 4 * len(arr))
+
+    data = read_fortran_binary(fid)
+    assert(data.dtype == np.float32)
+    assert(np.allclose(data, arr))
+
+    # Memory mapped reads should expose the same values without the markers
+    data_mmap = read_fortran_binary(fid, mmap=True)
+    assert(isinstance(data_mmap, np.memmap))
+    assert(np.array_equal(data_mmap, data))
+
+    # Empty and truncated files must raise rather than return garbage
+    fid_empty = os.path.join(tmpdir, "proc000000_empty.bin")
+    open(fid_empty, "wb").close()
+    with pytest.raises(ValueError):
+        read_fortran_binary(fid_empty)
+    with pytest.raises(ValueError):
+        read_fortran_binary(fid_empty, mmap=True)
+
+    with open(fid, "rb") as f:
+        contents = f.read()
+    fid_trunc = os.path.join(tmpdir, "proc000000_trunc.bin")
+    for size in [2, len(contents) - 1]:
+        with open(fid_trunc, "wb") as f:
+            f.write(contents[:size])
+        with pytest.raises(ValueError):
+            read_fortran_binary(fid_trunc)
+
+
+def test_get_offsets(su_stream):
+    """
+    Offsets are horizontal distances between each receiver and the source
+    """
+    assert(np.allclose(get_offsets(su_stream), [1000., 5000., 9000.]))
+
+
+def test_mask():
+    """
+    The mask is zero before the taper, one after it, and the taper spans
+    `length` samples centered on the mute time
+    """
+    # Mute time of 5s at 100Hz sampling is sample 500, taper is 300 -> 700
+    mask_arr = mask(slope=0., const=5., offset=0., nt=1000, dt=0.01,
+                    length=400)
+    assert(mask_arr.shape == (1000,))
+    assert(not mask_arr[:301].any())
+    assert((mask_arr[700:] == 1).all())
+    assert((np.diff(mask_arr[300:700]) > 0).all())
+
+
+def test_mute_arrivals(su_stream):
+    """
+    EARLY zeros samples before each trace's mute time, LATE zeros samples
+    after it. Mute times depend on the source-receiver distance of each trace
+    """
+    # t_mute = slope * offset + const -> 3s, 7s, 11s or sample 300, 700, 1100
+    # with 400 sample tapers centered on those samples
+    slope, const = 1E-3, 2.
+    itmins = [100, 500, 900]
+    itmaxs = [500, 900, 1300]
+
+    st_early = mute_arrivals(su_stream, slope=slope, const=const,
+                             choice="EARLY")
+    st_late = mute_arrivals(su_stream, slope=slope, const=const,
+                            choice="late")
+
+    for tr_early, tr_late, itmin, itmax in zip(st_early, st_late, itmins,
+                                               itmaxs):
+        # Leave a sample of slack for rounding of the mute time
+        assert(not tr_early.data[:itmin - 1].any())
+        assert((tr_early.data[itmax + 1:] == 1).all())
+        assert((tr_late.data[:itmin - 1] == 1).all())
+        assert(not tr_late.data[itmax + 1:].any())
+
+    # Input stream must not be modified in place
+    assert(all(tr.data.all() for tr in su_stream))
+
+
+def test_mute_offsets(su_stream):
+    """
+    SHORT mutes traces closer to the source than `dist`, LONG mutes traces
+    further away than `dist`; all other traces are left untouched
+    """
+    st_short = mute_offsets(su_stream, dist=4000., choice="SHORT")
+    assert([tr.data.any() for tr in st_short] == [False, True, True])
+
+    st_long = mute_offsets(su_stream, dist=4000., choice="long")
+    assert([tr.data.any() for tr in st_long] == [True, False, False])
+
+    # Input stream must not be modified in place
+    assert(all(tr.data.all() for tr in su_stream))
+
+
 def test_custom_import():
     """
     Test that importing based on internal modules works for various inputs
@@ -18,7 +18,7 @@ def count_zeros(a):
     :rtype: int
     :return: number of zeros in a
     """
-    return sum(np.array(a) == 0)
+    return np.count_nonzero(np.asarray(a) == 0)
 
 
 def sortrows(a, return_index=False, return_inverse=False):
@@ -3,16 +3,15 @@
 Seisflows configuration tools, containing core utilities that are called upon
 throughout the Seisflows workflow.
 """
-import dill
 import logging
 import os
 import sys
 import re
 import yaml
 import numpy as np
-import traceback
-from pkgutil import find_loader
+from functools import lru_cache
 from importlib import import_module
+from importlib.util import find_spec
 
 from seisflows import logger, NAMES
 from seisflows.tools import msg
@@ -66,9 +65,6 @@ class Null:
     def __bool__(self):
         return False
 
-    def __nonzero__(self):
-        return False
-
     def __getattr__(self, key):
         return self
 
@@ -90,8 +86,15 @@ def load_yaml(filename):
     :rtype: Dict
     :return: Dictionary containing all parameters in a YAML file
     """
+    # Prefer the LibYAML-backed C loader, which parses much faster than the
+    # pure-Python SafeLoader. Not all PyYAML builds are linked against LibYAML
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+
     # work around PyYAML bugs
-    yaml.SafeLoader.add_implicit_resolver(
+    loader.add_implicit_resolver(
         u'tag:yaml.org,2002:float',
         re.compile(u'''^(?:
          [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
@@ -103,7 +106,7 @@ def load_yaml(filename):
         list(u'-+0123456789.'))
 
     with open(filename, 'r') as f:
-        mydict = Dict(yaml.safe_load(f))
+        mydict = Dict(yaml.load(f, Loader=loader))
 
     if mydict is None:
         mydict = Dict()
@@ -202,6 +205,21 @@ def import_seisflows(workdir=os.getcwd(), parameter_file="parameters.yaml",
     return workflow
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Logging Formatter which re-uses the formatted timestamp for all records
+    created within the same second, as `datefmt` has no sub-second resolution
+    and time.strftime() is otherwise called for every log record
+    """
+    _cached_time = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if self._cached_time[0] != second:
+            self._cached_time = (second, super().formatTime(record, datefmt))
+        return self._cached_time[1]
+
+
 def config_logger(level="DEBUG", filename=None, filemode="a", verbose=True,
                   stream_handler=True):
     """
@@ -245,7 +263,7 @@ def config_logger(level="DEBUG", filename=None, filemode="a", verbose=True,
 
     # Instantiate logger during _register() as we now have user-defined pars
     logger.setLevel(level)
-    formatter = logging.Formatter(fmt_str, datefmt="%Y-%m-%d %H:%M:%S")
+    formatter = _CachedTimeFormatter(fmt_str, datefmt="%Y-%m-%d %H:%M:%S")
 
     # Stream handler to print log statements to stdout. Sometimes we don't want
     # this, e.g., on an HPC system having both stream and file will print
@@ -321,11 +339,28 @@ def custom_import(name=None, module=None, classname=None):
         else:
             classname = module.title().replace("_", "")
 
+    return _import_class(name, module, classname)
+
+
+@lru_cache(maxsize=None)
+def _import_class(name, module, classname):
+    """
+    Find, import and extract the requested class for `custom_import`. Cached
+    so that repeat calls with the same arguments skip the module search and
+    attribute lookups. Failures exit and so are never cached.
+
+    :type name: str
+    :param name: component of the workflow to import, e.g., 'workflow'
+    :type module: str
+    :param module: module within the workflow component, e.g., 'inversion'
+    :type classname: str
+    :param classname: the class to be extracted from the module
+    """
     # Check if modules exist, otherwise raise custom exception
     _exists = False
     full_dotted_name = ".".join(["seisflows", name, module])
-    # find_loader() checks if the module exists or not
-    if not find_loader(full_dotted_name):
+    # find_spec() checks if the module exists without executing it
+    if find_spec(full_dotted_name) is None:
         print(msg.cli(f"The following module was not found within the package: "
                       f"seisflows.{name}.{module}",
                       header="custom import error", border="=")
@@ -337,6 +372,7 @@ def custom_import(name=None, module=None, classname=None):
     try:
         module = import_module(full_dotted_name)
     except Exception as e:
+        import traceback  # only needed on failure
         print(msg.cli(f"Module could not be imported {full_dotted_name}",
                       items=[str(e)], header="custom import error", border="="))
         print(traceback.print_exc())
@@ -374,17 +410,19 @@ def pickle_function_list(functions, path=os.getcwd(), **kwargs):
     :return: (name of the pickle file containing the function,
         name of the pickle file containing keyword arguments)
     """
+    import dill  # slow to import and only needed for cluster runs
+
     # Save the instances that define the functions as a pickle object
     func_names = "_".join([_.__name__ for _ in functions])  # unique identifier
     fid_funcs_pickle = os.path.join(path, f"{func_names}.p")
 
     with open(fid_funcs_pickle, "wb") as f:
-        dill.dump(obj=functions, file=f)
+        f.write(dill.dumps(obj=functions, protocol=dill.HIGHEST_PROTOCOL))
 
     # Save the kwargs as a separate pickle object
     fid_kwargs_pickle = os.path.join(path, f"{func_names}_kwargs.p")
     with open(fid_kwargs_pickle, "wb") as f:
-        dill.dump(obj=kwargs, file=f)
+        f.write(dill.dumps(obj=kwargs, protocol=dill.HIGHEST_PROTOCOL))
 
     return fid_funcs_pickle, fid_kwargs_pickle
 
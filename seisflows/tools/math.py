@@ -175,7 +175,6 @@ def lsq2(x, f):
     if p[0] > 0:
         return -p[1]/(2*p[0])
     else:
-        print -1
         raise Exception()
 
 
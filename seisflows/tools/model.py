@@ -7,6 +7,7 @@ functions for SPECFEM2D models
 import os
 import numpy as np
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from glob import glob
 from seisflows import logger
@@ -229,7 +230,7 @@ class Model:
         if parameters is None:
             parameters = self.available_parameters
         else:
-            assert (set(parameters).union(set(self.available_parameters))), (
+            assert (set(parameters).issubset(self.available_parameters)), (
                 f"user-chosen parameters not in available: "
                 f"{self.available_parameters}"
             )
@@ -240,10 +241,15 @@ class Model:
                    ".adios": self._read_model_adios  # TODO Check if this okay
                    }[self.fmt]
 
-        # Create a dictionary object containing all parameters and their models
+        # Create a dictionary object containing all parameters and their models.
+        # Each parameter lives in its own set of files, so read them in
+        # parallel; NumPy releases the GIL during file I/O
         parameter_dict = Dict({key: [] for key in parameters})
-        for parameter in parameters:
-            parameter_dict[parameter] = load_fx(parameter=parameter)
+        with ThreadPoolExecutor(max_workers=min(8, len(parameters)) or 1) as \
+                executor:
+            arrays = executor.map(lambda p: load_fx(parameter=p), parameters)
+            for parameter, array in zip(parameters, arrays):
+                parameter_dict[parameter] = array
 
         return parameter_dict
 
@@ -264,8 +270,13 @@ class Model:
         """
         coordinates = {"x": [], "z": []}
         if self.fmt == ".bin":
-            coordinates["x"] = self._read_model_fortran_binary(parameter="x")
-            coordinates["z"] = self._read_model_fortran_binary(parameter="z")
+            try:
+                coordinates["x"] = self._read_model_fortran_binary(
+                    parameter="x")
+                coordinates["z"] = self._read_model_fortran_binary(
+                    parameter="z")
+            except FileNotFoundError:
+                coordinates = {"x": [], "z": []}
         elif self.fmt == ".dat":
             fids = glob(os.path.join(self.path,
                                      self.fnfmt(val="*", ext=".dat")))
@@ -304,15 +315,19 @@ class Model:
         :rtype: np.array
         :return: vector representation of the model
         """
-        m = np.array([])
         if parameter is None:
             parameters = self.parameters
         else:
             parameters = [parameter]
 
-        for parameter in parameters:
-            for iproc in range(self.nproc):
-                m = np.append(m, self.model[parameter][iproc])
+        # Gather all chunks first and join them in a single pass, rather than
+        # re-allocating the growing vector for every processor chunk. The
+        # leading empty (float64) array retains the previous type promotion
+        m = np.concatenate(
+            [np.array([])] +
+            [np.ravel(self.model[parameter][iproc]) for parameter in parameters
+             for iproc in range(self.nproc)]
+        )
 
         return m
 
@@ -349,14 +364,19 @@ class Model:
         if vector is None:
             vector = self.vector
 
+        # Start index of each processor chunk within a single parameter
+        offsets = np.cumsum([0] + list(self.ngll))
+        nglob = offsets[-1]
+
         model = Dict({key: [] for key in self.parameters})
         for idim, key in enumerate(self.parameters):
-            for iproc in range(self.nproc):
-                imin = sum(self.ngll) * idim + sum(self.ngll[:iproc])
-                imax = sum(self.ngll) * idim + sum(self.ngll[:iproc + 1])
-                model[key].extend([vector[imin:imax]])
-
-            model[key] = np.array(model[key])
+            vector_ = vector[nglob * idim:nglob * (idim + 1)]
+            # Equal sized processor chunks can be split with a single reshape
+            if len(set(self.ngll)) == 1:
+                model[key] = vector_.reshape(self.nproc, -1).copy()
+            else:
+                model[key] = np.array([vector_[offsets[i]:offsets[i + 1]]
+                                       for i in range(self.nproc)])
         return model
 
     def check(self, min_pr=-1., max_pr=0.5):
@@ -652,8 +672,10 @@ class Model:
         """
         acceptable_formats = {".bin", ".dat"}
 
-        files = glob(os.path.join(self.path, "*"))
-        suffixes = set([os.path.splitext(_)[1] for _ in files])
+        # Stream directory entries rather than materializing a list of paths
+        with os.scandir(self.path) as entries:
+            suffixes = {os.path.splitext(entry.name)[1] for entry in entries
+                        if not entry.name.startswith(".")}
         fmt = acceptable_formats.intersection(suffixes)
         assert (len(fmt) == 1), (
             f"cannot guess model format, multiple matching acceptable formats "
@@ -670,13 +692,14 @@ class Model:
         :rtype: str
         :return: SPECFEM flavor, one of ['2D', '3D', '3DGLOBE']
         """
-        fullpaths = glob(os.path.join(self.path, f"*{self.fmt}"))
-        assert fullpaths, f"cannot find files for flavor guessing"
-
         # Not the most accurate way of doing this, but serves a purpose
-        fids = [os.path.basename(_) for _ in fullpaths]
-        fids = [os.path.splitext(_)[0] for _ in fids]
-        unique_tags = set(["_".join(_.split("_")[1:]) for _ in fids])
+        with os.scandir(self.path) as entries:
+            unique_tags = {
+                "_".join(os.path.splitext(entry.name)[0].split("_")[1:])
+                for entry in entries if entry.name.endswith(self.fmt)
+                and not entry.name.startswith(".")
+            }
+        assert unique_tags, f"cannot find files for flavor guessing"
     
         if self.regions and self.regions[0] in unique_tags:
             flavor = "3DGLOBE"
@@ -698,11 +721,13 @@ class Model:
         :rtype: np.array
         :return: vector of model values for given `parameter`
         """
+        # Number of processors is already known, so build filenames directly
+        # (in numerical order) rather than searching the directory each time
         array = []
-        fids = glob(os.path.join(
-            self.path, self.fnfmt(val=parameter, ext=".bin"))
-        )
-        for fid in sorted(fids):  # make sure were going in numerical order
+        for iproc in range(self.nproc):
+            fid = os.path.join(
+                self.path, self.fnfmt(i=iproc, val=parameter, ext=".bin")
+            )
             array.append(read_fortran_binary(fid))
 
         # !!! Causes a visible deprecation warning from NumPy but setting
@@ -761,9 +786,15 @@ class Model:
             as 'int32' at the top and bottom of the data array.
             https://docs.oracle.com/cd/E19957-01/805-4939/6j4m0vnc4/index.html
         """
-        for parameter in self.parameters:
+        def _write_parameter(parameter):
             for i, data in enumerate(self.model[parameter]):
                 filename = self.fnfmt(i=i, val=parameter, ext=".bin")
                 filepath = os.path.join(path, filename)
                 write_fortran_binary(arr=data, filename=filepath)
 
+        # Parameters are written to separate files so they can be written in
+        # parallel. list() ensures any exceptions raised are propagated
+        with ThreadPoolExecutor(max_workers=min(8, len(self.parameters)) or 1) \
+                as executor:
+            list(executor.map(_write_parameter, self.parameters))
+
@@ -9,6 +9,25 @@ interact with ObsPy trace and stream objects
     the SeisFlows example problems.
 """
 import numpy as np
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _taper_window(length):
+    """
+    Rising half of a sine taper of `length` samples, used by `mask`. Cached as
+    the window only depends on `length`, so the trigonometry is computed once
+    rather than for every trace that is muted. The returned array is read-only
+    as it is shared between calls
+
+    :type length: int
+    :param length: number of samples in the taper
+    :rtype: np.array
+    :return: read-only taper window
+    """
+    win = np.sin(np.linspace(0, np.pi, 2*length))[0:length]
+    win.flags.writeable = False
+    return win
 
 
 def mask(slope, const, offset, nt, dt, length=400):
@@ -45,11 +64,10 @@ def mask(slope, const, offset, nt, dt, length=400):
     mask_arr = np.ones(nt)
 
     # construct taper
-    win = np.sin(np.linspace(0, np.pi, 2*length))
-    win = win[0:length]
+    win = _taper_window(length)
 
     # Caculate offsets
-    itmin = int(np.ceil((slope * abs(offset) + const) / dt)) - length / 2
+    itmin = int(np.ceil((slope * abs(offset) + const) / dt)) - length // 2
     itmax = itmin + length
 
     # Generate parts of the mask array based on offsets
@@ -82,25 +100,23 @@ def mute_arrivals(st, slope, const, choice):
     :rtype: obspy.stream
     :return: muted stream object
     """
-    assert choice.upper() in ["EARLY", "LATE"]
+    choice = choice.upper()
+    assert choice in ["EARLY", "LATE"]
     st_out = st.copy()
 
-    # Get the source and receiver coordinates and time info
+    # Get the source receiver distances and time info
     nt = st_out[0].stats.npts
     dt = st_out[0].stats.delta
-    s_coords = get_receiver_coords(st)
-    r_coords = get_receiver_coords(st)
-
-    for i, tr in enumerate(st_out):
-        sx, sy, sz = s_coords[:][i]
-        rx, ry, rz = r_coords[:][i]
-        # Determine the distance between source and receiver
-        offset = np.sqrt((rx - sx) ** 2 + (ry - sy) ** 2)
+    offsets = get_offsets(st)
+
+    # Late arrivals are muted with the complement of the mask
+    invert = (choice == "LATE")
+
+    for tr, offset in zip(st_out, offsets):
         mask_arr = mask(slope=slope, const=const, offset=offset, nt=nt, dt=dt)
-        if choice == "early":
-            tr.data *= mask_arr
-        elif choice == "late":
-            tr.data *= 1 - mask_arr
+        if invert:
+            mask_arr = 1 - mask_arr
+        tr.data *= mask_arr
 
     return st_out
 
@@ -121,27 +137,40 @@ def mute_offsets(st, dist, choice):
     :rtype: obspy.stream
     :return: muted stream object
     """
-    assert choice.upper() in ["LONG", "SHORT"]
+    choice = choice.upper()
+    assert choice in ["LONG", "SHORT"]
     st_out = st.copy()
 
-    # Get the source and receiver coordinates
-    s_coords = get_receiver_coords(st)
-    r_coords = get_receiver_coords(st)
-
-    for i, tr in enumerate(st_out):
-        sx, sy, sz = s_coords[:][i]
-        rx, ry, rz = r_coords[:][i]
-        # Determine the distance between source and receiver
-        offset = np.sqrt((rx - sx) ** 2 + (ry - sy) ** 2)
+    # Determine which traces to mute for all source receiver distances at once
+    offsets = get_offsets(st)
+    if choice == "LONG":
+        mute = offsets > dist
+    else:
+        mute = offsets < dist
 
-        if choice == "long" and (offset < dist):
-            tr.data *= 0
-        elif choice == "short" and (offset > dist):
+    for tr, mute_trace in zip(st_out, mute):
+        if mute_trace:
             tr.data *= 0
 
     return st_out
 
 
+def get_offsets(st):
+    """
+    Calculate the horizontal source-receiver distance for every trace in a
+    Stream object in one go. Only works for SU format currently
+
+    :type st: obspy.core.stream.Stream
+    :param st: a stream to query for coordinates
+    :rtype: np.array
+    :return: source-receiver distances, matching the order in `st`
+    """
+    sx, sy, _ = get_source_coords(st)
+    rx, ry, _ = get_receiver_coords(st)
+
+    return np.hypot(np.subtract(rx, sx), np.subtract(ry, sy))
+
+
 def get_receiver_coords(st):
     """
     Retrieve the coordinates from a Stream object.
@@ -3,6 +3,7 @@ Utilities to interact with, manipulate or call on the external solver,
 i.e., SPECFEM2D/3D/3D_GLOBE
 """
 import os
+import errno
 import numpy as np
 from glob import glob
 from seisflows import logger
@@ -260,7 +261,7 @@ def setpar_vel_model(file, model):
     setpar(key="nbmodels", val=len(model), file=file)
 
 
-def read_fortran_binary(filename):
+def read_fortran_binary(filename, mmap=False):
     """
     Reads Fortran-style unformatted binary data into numpy array.
 
@@ -272,23 +273,66 @@ def read_fortran_binary(filename):
 
     :type filename: str
     :param filename: full path to the Fortran unformatted binary file to read
+    :type mmap: bool
+    :param mmap: memory-map the file rather than reading it into memory. The
+        returned array is read-only and pages are only loaded from disk when
+        they are accessed, which is useful for large files that are only
+        reduced over (e.g., dot products, norms)
     :rtype: np.array
     :return: numpy array with data with data read in as type Float32
     """
-    nbytes = os.path.getsize(filename)
+    if mmap:
+        return _read_fortran_binary_mmap(filename)
+
+    # Read the record marker, then read the data directly into a preallocated
+    # array so that the payload is only allocated once and never copied
     with open(filename, "rb") as file:
-        # read size of record
-        file.seek(0)
-        n = np.fromfile(file, dtype="int32", count=1)[0]
-
-        if n == nbytes - 8:
-            file.seek(4)
-            data = np.fromfile(file, dtype="float32")
-            return data[:-1]
+        nbytes = os.fstat(file.fileno()).st_size
+        n = np.zeros(1, dtype="int32")
+        if file.readinto(n) != n.nbytes:
+            raise ValueError(f"Fortran binary file is empty or truncated, "
+                             f"{nbytes} bytes: {filename}")
+
+        if n[0] == nbytes - 8:
+            data = np.zeros(n[0] // 4, dtype="float32")
         else:
+            # No matching record marker, treat the whole file as raw data
+            if nbytes % 4:
+                raise ValueError(f"Fortran binary file is truncated, {nbytes} "
+                                 f"bytes is not a whole number of float32 "
+                                 f"values: {filename}")
             file.seek(0)
-            data = np.fromfile(file, dtype="float32")
-            return data
+            data = np.zeros(nbytes // 4, dtype="float32")
+        if file.readinto(data) != data.nbytes:
+            raise ValueError(f"Fortran binary file is truncated, expected "
+                             f"{data.nbytes} bytes of data: {filename}")
+
+    return data
+
+
+def _read_fortran_binary_mmap(filename):
+    """
+    Memory-mapped counterpart to `read_fortran_binary`. Only the leading record
+    marker is read, the data itself is exposed as a read-only np.memmap
+
+    :type filename: str
+    :param filename: full path to the Fortran unformatted binary file to read
+    :rtype: np.memmap
+    :return: read-only memory-mapped array of type Float32
+    """
+    nbytes = os.path.getsize(filename)
+    if nbytes < 4:
+        raise ValueError(f"Fortran binary file is empty or truncated, "
+                         f"{nbytes} bytes: {filename}")
+    n = int(np.fromfile(filename, dtype="int32", count=1)[0])
+
+    if n == nbytes - 8:
+        offset, count = 4, n // 4
+    else:
+        offset, count = 0, nbytes // 4
+
+    return np.memmap(filename, dtype="float32", mode="r", offset=offset,
+                     shape=(count,))
 
 
 def write_fortran_binary(arr, filename):
@@ -307,10 +351,22 @@ def write_fortran_binary(arr, filename):
     :param filename: full path to file that should be written in format
         unformatted Fortran binary
     """
-    buffer = np.array([4 * len(arr)], dtype="int32")
-    data = np.array(arr, dtype="float32")
+    # Assemble the full record (marker, data, marker) in a single buffer so
+    # that it can be written with one call, rather than one per component.
+    # The data are cast to float32 as they are copied in
+    data = np.ravel(arr)
+    record = np.empty(data.size + 2, dtype="float32")
+    record[1:-1] = data
+    record.view("int32")[[0, -1]] = 4 * data.size
 
     with open(filename, "wb") as file:
-        buffer.tofile(file)
-        data.tofile(file)
-        buffer.tofile(file)
+        # Reserve the full file size up front so the filesystem can allocate
+        # contiguous extents, and so a full disk fails before writing
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(file.fileno(), 0, record.nbytes)
+            except OSError as e:
+                # Some filesystems do not support preallocation, that's okay
+                if e.errno == errno.ENOSPC:
+                    raise
+        record.tofile(file)
@@ -8,6 +8,7 @@ import time
 import random
 import shutil
 import socket
+import stat
 import subprocess
 
 
@@ -199,10 +200,15 @@ def rm(path):
     Remove files or directories
     """
     for name in _iterable(path):
-        if os.path.isfile(name) or os.path.islink(name):
-            os.remove(name)
-        elif os.path.isdir(name):
+        # A single lstat per entry; symlinks are removed, not followed
+        try:
+            mode = os.lstat(name).st_mode
+        except FileNotFoundError:
+            continue
+        if stat.S_ISDIR(mode):
             shutil.rmtree(name)
+        else:
+            os.remove(name)
 
 
 def select(items, prompt=''):
@@ -257,13 +257,32 @@ class Forward:
         with open(self.path.state_file, "r") as f:
             lines = f.readlines()
 
-        with open(self.path.state_file, "w") as f:
+        # Write to a temporary file and rename it over the state file, so that
+        # a crash mid-write cannot leave behind a truncated state file
+        tmp_file = f"{self.path.state_file}.tmp"
+        with open(tmp_file, "w") as f:
             # Rewrite header values
             for line in lines:
                 if line.startswith("#"):
                     f.write(line)
             for key, val in self._states.items():
                 f.write(f"{key}: {val}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.path.state_file)
+
+        # Persist the rename itself by syncing the parent directory (POSIX)
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.path.state_file)),
+                         os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
     def run(self):
         """
@@ -274,7 +293,9 @@ class Forward:
         logger.info(msg.mjr(f"RUNNING {self.__class__.__name__.upper()} "
                             f"WORKFLOW"))
 
-        for func in self.task_list:
+        # Build the task list once; the property creates a new list each call
+        task_list = self.task_list
+        for func in task_list:
             # Skip over functions which have already been completed
             if (func.__name__ in self._states.keys()) and (
                     self._states[func.__name__] == "completed"):
@@ -297,7 +318,7 @@ class Forward:
                 break
 
         self.checkpoint()
-        logger.info(f"finished all {len(self.task_list)} tasks in task list")
+        logger.info(f"finished all {len(task_list)} tasks in task list")
 
     def evaluate_initial_misfit(self):
         """
@@ -355,28 +376,31 @@ class Forward:
             Must be run by system.run() so that solvers are assigned individual
             task ids and working directories
         """
-        logger.info(f"preparing observation data for source "
-                    f"{self.solver.source_name}")
+        # Property lookups depend on the task id, resolve them once per task
+        source_name = self.solver.source_name
+        cwd = self.solver.cwd
+
+        logger.info(f"preparing observation data for source {source_name}")
 
         if self.data_case == "data":
             logger.info(f"copying data from `path_data`")
-            src = os.path.join(self.path.data, self.solver.source_name, "*")
-            dst = os.path.join(self.solver.cwd, "traces", "obs", "")
+            src = os.path.join(self.path.data, source_name, "*")
+            dst = os.path.join(cwd, "traces", "obs", "")
             unix.cp(src, dst)
         elif self.data_case == "synthetic":
             # Figure out where to export waveform files to, if requested
             if self.export_traces:
-                export_traces = os.path.join(self.path.output,
-                                             self.solver.source_name, "obs")
+                export_traces = os.path.join(self.path.output, source_name,
+                                             "obs")
             else:
                 export_traces = False
 
             # Run the forward solver with target model and save traces the 'obs'
             logger.info(f"running forward simulation w/ target model for "
-                        f"{self.solver.source_name}")
+                        f"{source_name}")
             self.solver.import_model(path_model=self.path.model_true)
             self.solver.forward_simulation(
-                save_traces=os.path.join(self.solver.cwd, "traces", "obs"),
+                save_traces=os.path.join(cwd, "traces", "obs"),
                 export_traces=export_traces, save_forward=False
             )
 
@@ -394,8 +418,9 @@ class Forward:
         assert(os.path.exists(path_model)), \
             f"Model path for objective function does not exist"
 
-        logger.info(f"evaluating objective function for source "
-                    f"{self.solver.source_name}")
+        source_name = self.solver.source_name
+
+        logger.info(f"evaluating objective function for source {source_name}")
         logger.debug(f"running forward simulation with "
                      f"'{self.solver.__class__.__name__}'")
 
@@ -403,7 +428,7 @@ class Forward:
         # path will look like: 'output/solver/001/syn/NN.SSS.BXY.semd'
         if self.export_traces:
             export_traces = os.path.join(self.path.output, "solver",
-                                         self.solver.source_name, "syn")
+                                         source_name, "syn")
         else:
             export_traces = False
 
@@ -435,8 +460,10 @@ class Forward:
                          "objective function")
             return
 
+        source_name = self.solver.source_name
+
         if save_residuals:
-            save_residuals = save_residuals.format(src=self.solver.source_name)
+            save_residuals = save_residuals.format(src=source_name)
 
         if self.export_residuals:
             export_residuals = os.path.join(self.path.output, "residuals")
@@ -446,7 +473,7 @@ class Forward:
         logger.debug(f"quantifying misfit with "
                      f"'{self.preprocess.__class__.__name__}'")
         self.preprocess.quantify_misfit(
-            source_name=self.solver.source_name,
+            source_name=source_name,
             save_adjsrcs=os.path.join(self.solver.cwd, "traces", "adj"),
             save_residuals=save_residuals,
             export_residuals=export_residuals
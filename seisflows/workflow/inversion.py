@@ -197,19 +197,11 @@ class Inversion(Migration):
         """
         Add an additional line in the state file to keep track of iteration,
         """
+        # Clear out the previous 'iteration' state and add in new at the end so
+        # that the state file is only written once, by the parent class
+        self._states.pop("iteration", None)
+        self._states["iteration"] = self.iteration
         super().checkpoint()
-        with open(self.path.state_file, "r") as f:
-            lines = f.readlines()
-        # Clear out the previous 'iteration' line and add in new
-        for i, line in enumerate(lines[:]):
-            if "iteration:" in line:
-                lines.pop(i)
-                break
-        lines.append(f"iteration: {self.iteration}")
-
-        # Rewrite checkpoint file with new iteration line
-        with open(self.path.state_file, "w") as f:
-            f.writelines(lines)
 
     def evaluate_objective_function(self, save_residuals=False, **kwargs):
         """
@@ -225,9 +217,11 @@ class Inversion(Migration):
         logger.debug(f"quantifying misfit with "
                      f"'{self.preprocess.__class__.__name__}'")
 
+        source_name = self.solver.source_name
+
         # If line search, add step count as suffix in the residuals file
         if save_residuals:
-            save_residuals = save_residuals.format(src=self.solver.source_name)
+            save_residuals = save_residuals.format(src=source_name)
 
         if self.export_residuals:
             export_residuals = os.path.join(self.path.output, "residuals")
@@ -235,7 +229,7 @@ class Inversion(Migration):
             export_residuals = False
 
         self.preprocess.quantify_misfit(
-            source_name=self.solver.source_name,
+            source_name=source_name,
             save_adjsrcs=os.path.join(self.solver.cwd, "traces", "adj"),
             save_residuals=save_residuals,
             export_residuals=export_residuals,
@@ -20,7 +20,7 @@ model
 import os
 import sys
 import shutil
-from glob import glob
+from glob import iglob
 from seisflows import logger
 from seisflows.tools import msg, unix
 from seisflows.tools.model import Model
@@ -110,19 +110,20 @@ class Migration(Forward):
         """
         def run_adjoint_simulation():
             """Adjoint simulation function to be run by system.run()"""
+            source_name = self.solver.source_name
+
             if self.export_kernels:
                 export_kernels = os.path.join(self.path.output, "kernels",
-                                              self.solver.source_name)
+                                              source_name)
             else:
                 export_kernels = False
 
-            logger.info(f"running adjoint simulation for source "
-                        f"{self.solver.source_name}")
+            logger.info(f"running adjoint simulation for source {source_name}")
             # Run adjoint simulations on system. Make kernels discoverable in
             # path `eval_grad`. Optionally export those kernels
             self.solver.adjoint_simulation(
                 save_kernels=os.path.join(self.path.eval_grad, "kernels",
-                                          self.solver.source_name, ""),
+                                          source_name, ""),
                 export_kernels=export_kernels
             )
 
@@ -183,7 +184,7 @@ class Migration(Forward):
 
         # Check that kernel files exist before attempting to manipulate
         misfit_kernel_path = os.path.join(self.path.eval_grad, "misfit_kernel")
-        if not glob(os.path.join(misfit_kernel_path, "*")):
+        if not next(iglob(os.path.join(misfit_kernel_path, "*")), None):
             logger.critical(msg.cli(
                 "directory 'scratch/eval_grad/misfit_kernel' is empty but "
                 "should contain summed kernels. Please check "